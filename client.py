@@ -18,6 +18,7 @@ from typing import Union
 from datetime import datetime, timedelta
 from flask import Flask, request
 from wrappers.db_wrapper import DBWrapper
+from wrappers.geo_index import GeoIndex
 from wrappers.requets_wrapper import RequestWrapper
 
 """
@@ -27,6 +28,7 @@ MySQL tables:
 2. deliveries
 3. deliveries_by_day
 4. timeslots
+5. service_areas
 
 Please run the db script (that provided with the project files) to create all tables correctly.
 """
@@ -47,6 +49,8 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s | %(levelname)-10s |
 app = Flask(__name__)
 db_obj = DBWrapper(host=MYSQL_IP, mysql_user=MYSQL_USER, mysql_pass=MYSQL_PASS, database=MYSQL_SCHEMA)
 threadLock = threading.Lock()
+serviceAreasLock = threading.Lock()
+service_areas_index = None
 
 ##### Admin Endpoints #####
 
@@ -135,6 +139,95 @@ def upload_new_timeslots():
         return "The provided user admin is invalid.", 400
 
 
+@app.route('/upload-service-areas', methods=['POST'])
+def upload_service_areas():
+    """
+    ** Admin Endpoint **
+
+    This method responsible on the uploading of the cities service areas (polygon or radius).
+    The uploaded areas of a city replace all of its existing areas.
+
+    # payload example:
+    {
+        "username": <username>,
+        "password": <password>,
+        "service_areas": [
+            {
+                "city": <city>,
+                "polygon": [[<lat>, <lng>], [<lat>, <lng>], [<lat>, <lng>]]
+            },
+            {
+                "city": <city>,
+                "center": [<lat>, <lng>],
+                "radius_km": <radius>
+            }
+        ]
+    }
+    """
+    global service_areas_index
+
+    payload = verify_json_structure(['username', 'password', 'service_areas'])
+    if isinstance(payload, tuple):
+        return payload
+
+    valid = verify_admin(username=payload['username'], password=payload['password'])
+    if not valid:
+        return "The provided user admin is invalid.", 400
+
+    if not isinstance(payload['service_areas'], list):
+        return "Bad request. please check the sent data.", 400
+
+    bad_service_areas = []
+    rows_by_city = {}
+    for service_area in payload['service_areas']:
+        if not isinstance(service_area, dict) or not isinstance(service_area.get('city'), str) or not service_area['city'].strip():
+            bad_service_areas.append(f"'{service_area}' - invalid service area.\n")
+            continue
+
+        # Adding the area to a throwaway index validates it before it's stored.
+        try:
+            if 'polygon' in service_area.keys():
+                points = [(float(lat), float(lng)) for lat, lng in service_area['polygon']]
+                GeoIndex().add_polygon(service_area['city'], points)
+                current_row = {
+                    'city': service_area['city'],
+                    'polygon': ','.join(f"{lat} {lng}" for lat, lng in points)
+                }
+            else:
+                center_lat, center_lng = (float(value) for value in service_area['center'])
+                radius_km = float(service_area['radius_km'])
+                GeoIndex().add_radius(service_area['city'], center_lat, center_lng, radius_km)
+                current_row = {
+                    'city': service_area['city'],
+                    'center_lat': center_lat,
+                    'center_lng': center_lng,
+                    'radius_km': radius_km
+                }
+        except (KeyError, TypeError, ValueError, OverflowError) as e:
+            bad_service_areas.append(f"'{service_area}' - invalid service area. Reason - '{e}'.\n")
+            continue
+
+        rows_by_city.setdefault(service_area['city'], []).append(current_row)
+
+    for city, rows in rows_by_city.items():
+        if db_obj.remove_row_if_exists(table_name='service_areas', field_condition='city', value_condition=city) is False:
+            bad_service_areas.append(f"'{city}' - Didn't manage to replace the existing service areas.\n")
+            continue
+
+        for row in rows:
+            if not db_obj.insert_row(table_name='service_areas', keys_values=row):
+                bad_service_areas.append(f"'{row}' - Syntax Issue.\n")
+
+    # The index will be rebuilt from the DB by the next timeslots request.
+    with serviceAreasLock:
+        service_areas_index = None
+
+    if bad_service_areas:
+        return f"One or more service areas wasn't inserted:\n{''.join(bad_service_areas)}"
+
+    return "All service areas were inserted successfully.", 200
+
+
 ######################
 
 
@@ -170,6 +263,40 @@ def get_geocoding_object(address: str) -> Union[dict, None]:
     return parsed_response
 
 
+def get_service_areas_index() -> Union[GeoIndex, None]:
+    """
+    This method returns the in-memory spatial index of the service areas.
+    The index is built from the DB on the first call and kept until new service areas are uploaded.
+    :return: GeoIndex object | None if the DB query failed
+    """
+    global service_areas_index
+
+    with serviceAreasLock:
+        if service_areas_index is None:
+            # Calling execute_command directly since get_all_values_by_field returns None for an empty table as well.
+            all_service_areas = db_obj.execute_command("SELECT * FROM service_areas")
+            if all_service_areas is False:
+                return None
+
+            index = GeoIndex()
+            for service_area in all_service_areas:
+                try:
+                    if service_area['polygon']:
+                        points = [tuple(float(value) for value in point.split()) for point in service_area['polygon'].split(',')]
+                        index.add_polygon(service_area['city'], points)
+                    else:
+                        index.add_radius(service_area['city'], service_area['center_lat'], service_area['center_lng'], service_area['radius_km'])
+                except (TypeError, ValueError, OverflowError) as e:
+                    logging.error(f"Skipping invalid service area (ID - '{service_area['id']}'). Reason - '{e}'")
+            if len(index):
+                logging.info(f"Loaded {len(index)} service areas into the spatial index.")
+            else:
+                logging.warning("There are no service areas, no timeslots will be matched. Upload them by /upload-service-areas.")
+            service_areas_index = index
+
+        return service_areas_index
+
+
 def get_holidays() -> Union[dict, None]:
     defined_url = f"https://holidayapi.com/v1/holidays"
     # Free accounts are limited to last year's historical data only, so i wrote "-1" to the year key but for payed account we should remove it.
@@ -214,6 +341,30 @@ def get_timeslots():
     if isinstance(payload, tuple):
         return payload
 
+    geocoding_details = get_geocoding_object(payload['address'])
+    if not geocoding_details:
+        return "Internal Error", 500
+
+    geocoding_status = geocoding_details.get('status')
+    if geocoding_status == 'ZERO_RESULTS':
+        return 'No Coordinates. Check the provided address.', 404
+    if geocoding_status != 'OK':
+        logging.error(f"GeoCoding request by the address - '{payload['address']}' failed with status '{geocoding_status}'")
+        return "Internal Error", 500
+
+    try:
+        location = geocoding_details['results'][0]['geometry']['location']
+    except (KeyError, IndexError, TypeError):
+        return "Internal Error", 500
+
+    areas_index = get_service_areas_index()
+    if areas_index is None:
+        return "Internal DB issue, ask devs.", 500
+
+    cities = areas_index.query(location['lat'], location['lng'])
+    if not cities:
+        return "No available timeslots by the provided address.", 404
+
     matched_timeslots = []
 
     datetime_now = datetime.now()
@@ -222,7 +373,7 @@ def get_timeslots():
         return "Internal DB issue, ask devs.", 500
 
     for timeslot in all_timeslots:
-        if timeslot['start_time'] > datetime_now and timeslot['city'].lower() in payload['address'].lower():
+        if timeslot['start_time'] > datetime_now and timeslot['city'].lower() in cities:
             matched_timeslots.append(timeslot)
 
     if matched_timeslots:
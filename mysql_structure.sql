@@ -62,6 +62,25 @@ CREATE TABLE `deliveries_by_day` (
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
 /*!40101 SET character_set_client = @saved_cs_client */;
 
+--
+-- Table structure for table `service_areas`
+--
+
+DROP TABLE IF EXISTS `service_areas`;
+/*!40101 SET @saved_cs_client     = @@character_set_client */;
+/*!50503 SET character_set_client = utf8mb4 */;
+CREATE TABLE `service_areas` (
+  `id` int NOT NULL AUTO_INCREMENT,
+  `city` varchar(45) NOT NULL,
+  `polygon` text DEFAULT NULL,
+  `center_lat` double DEFAULT NULL,
+  `center_lng` double DEFAULT NULL,
+  `radius_km` double DEFAULT NULL,
+  PRIMARY KEY (`id`),
+  KEY `city` (`city`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
+/*!40101 SET character_set_client = @saved_cs_client */;
+
 --
 -- Table structure for table `timeslots`
 --
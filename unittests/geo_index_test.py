@@ -0,0 +1,65 @@
+import unittest
+from wrappers.geo_index import GeoIndex, point_in_polygon, haversine_km
+
+TEL_AVIV_POLYGON = [(32.03, 34.74), (32.03, 34.85), (32.15, 34.85), (32.15, 34.74)]
+
+
+class GeoIndexTests(unittest.TestCase):
+    def setUp(self):
+        self.index = GeoIndex()
+
+    def test1_point_in_polygon(self):
+        self.assertTrue(point_in_polygon(32.08, 34.78, TEL_AVIV_POLYGON))
+        self.assertFalse(point_in_polygon(32.20, 34.78, TEL_AVIV_POLYGON))
+
+    def test2_haversine_km(self):
+        self.assertAlmostEqual(haversine_km(32.08, 34.78, 32.08, 34.78), 0)
+        # One latitude degree is ~111km.
+        self.assertAlmostEqual(haversine_km(32, 34.78, 33, 34.78), 111.2, delta=0.5)
+
+    def test3_query_polygon(self):
+        self.index.add_polygon('Tel Aviv', TEL_AVIV_POLYGON)
+
+        self.assertEqual(self.index.query(32.08, 34.78), {'tel aviv'})
+        self.assertEqual(self.index.query(32.20, 34.78), set())
+
+    def test4_query_radius(self):
+        self.index.add_radius('Haifa', 32.79, 34.99, 5)
+
+        self.assertEqual(self.index.query(32.80, 35.00), {'haifa'})
+        # Inside the bounding box cells but outside the circle.
+        self.assertEqual(self.index.query(32.83, 35.03), set())
+
+    def test5_polygon_over_multiple_cells(self):
+        self.index.add_polygon('Tel Aviv', TEL_AVIV_POLYGON)
+
+        # The polygon spans several 0.05 degree cells, including points that lie exactly on a cell boundary.
+        for lat, lng in [(32.04, 34.75), (32.14, 34.84), (32.10, 34.80), (32.05, 34.75)]:
+            self.assertEqual(self.index.query(lat, lng), {'tel aviv'})
+
+    def test6_invalid_polygon(self):
+        self.assertRaises(ValueError, self.index.add_polygon, 'x', [(32.0, 34.0), (32.1, 34.1)])
+        self.assertRaises(ValueError, self.index.add_polygon, 'x', [(1e5, 0), (0, 1e5), (0, 0)])
+        self.assertEqual(len(self.index), 0)
+
+    def test7_invalid_radius(self):
+        for lat, lng, radius_km in [(32, 34, 0), (32, 34, -1), (32, 34, 3000), (32, 34, float('inf')), (91, 34, 5), (32, 181, 5), (float('nan'), 34, 5)]:
+            self.assertRaises(ValueError, self.index.add_radius, 'x', lat, lng, radius_km)
+        self.assertEqual(len(self.index), 0)
+
+    def test8_radius_over_antimeridian(self):
+        self.index.add_radius('Fiji', -17, 179.99, 20)
+
+        self.assertEqual(self.index.query(-17, -179.99), {'fiji'})
+        self.assertEqual(self.index.query(-17, 179.9), {'fiji'})
+
+    def test9_invalid_city(self):
+        for city in [5, None, ' ']:
+            self.assertRaises(ValueError, self.index.add_polygon, city, TEL_AVIV_POLYGON)
+            self.assertRaises(ValueError, self.index.add_radius, city, 32.79, 34.99, 5)
+        self.assertRaises(ValueError, self.index.add_polygon, 'x', [(-17, 179), (-17, -179), (-18, -179)])
+        self.assertEqual(len(self.index), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
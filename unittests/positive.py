@@ -37,6 +37,23 @@ class PositiveTests(unittest.TestCase):
         self.assertIsInstance(response, requests.Response)
         self.assertEqual(response.status_code, 200)
 
+    # End Point Test
+    def test1b_upload_service_areas(self):
+        endpoint = '/upload-service-areas'
+        data = {
+            'username': 'test_user',
+            'password': self.test_user_password,
+            'service_areas': [{
+                'city': 'Tel Aviv',
+                'polygon': [[32.03, 34.74], [32.03, 34.85], [32.15, 34.85], [32.15, 34.74]]
+            }]
+        }
+        response = self.request_obj.perform_request(method='POST', url=f'{self.host}{endpoint}', data=data, headers=self.headers)
+
+        self.assertIsNotNone(response)
+        self.assertIsInstance(response, requests.Response)
+        self.assertEqual(response.status_code, 200)
+
     # End Point Test
     def test2_resolve_address(self):
         endpoint = '/resolve-address'
@@ -52,6 +69,7 @@ class PositiveTests(unittest.TestCase):
 
     # End Point Test
     def test3_timeslots(self):
+        # Relies on the Tel Aviv service area that test1b_upload_service_areas uploads.
         endpoint = '/timeslots'
 
         data = {'address': 'menchem begin 140 tel aviv israel'}
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+__author__ = 'Tony Schneider'
+__email__ = 'tonysch05@gmail.com'
+
+import math
+from collections import defaultdict
+
+EARTH_RADIUS_KM = 6371.0
+KM_PER_LAT_DEGREE = 111.32
+MAX_RADIUS_KM = 500.0
+MAX_AREA_CELLS = 250000
+
+
+class GeoIndex:
+    def __init__(self, cell_size: float = 0.05):
+        """
+        This class holds the service areas in memory and answers point-in-area queries.
+        The areas are bucketed by a uniform grid (cell_size in degrees), so each query checks only the areas
+        that overlap the cell of the point instead of scanning all of them.
+        :param cell_size: grid cell size in degrees (0.05 is ~5km)
+        """
+        self.cell_size = cell_size
+        self._cells = defaultdict(list)
+        self._areas = []
+
+    def __len__(self) -> int:
+        return len(self._areas)
+
+    def _cell(self, lat: float, lng: float) -> tuple:
+        return math.floor(lat / self.cell_size), math.floor(lng / self.cell_size)
+
+    def _insert(self, area: dict, min_lat: float, min_lng: float, max_lat: float, max_lng: float) -> None:
+        # A bounding box that crosses the antimeridian is split into a range on each side of it.
+        if max_lng - min_lng >= 360:
+            lng_ranges = [(-180.0, 180.0)]
+        elif min_lng < -180:
+            lng_ranges = [(min_lng + 360, 180.0), (-180.0, max_lng)]
+        elif max_lng > 180:
+            lng_ranges = [(min_lng, 180.0), (-180.0, max_lng - 360)]
+        else:
+            lng_ranges = [(min_lng, max_lng)]
+
+        min_row = self._cell(max(min_lat, -90.0), 0)[0]
+        max_row = self._cell(min(max_lat, 90.0), 0)[0]
+        col_ranges = [(self._cell(0, range_min)[1], self._cell(0, range_max)[1]) for range_min, range_max in lng_ranges]
+        if (max_row - min_row + 1) * sum(max_col - min_col + 1 for min_col, max_col in col_ranges) > MAX_AREA_CELLS:
+            raise ValueError(f"The area of '{area['city']}' is too large for the index.")
+
+        self._areas.append(area)
+        for row in range(min_row, max_row + 1):
+            for min_col, max_col in col_ranges:
+                for col in range(min_col, max_col + 1):
+                    self._cells[(row, col)].append(area)
+
+    def add_polygon(self, city: str, points: list) -> None:
+        """
+        :param city: the city that the area belongs to
+        :param points: list of (lat, lng) vertices
+        """
+        validate_city(city)
+        if len(points) < 3:
+            raise ValueError(f"A polygon needs at least 3 points, got {len(points)}.")
+        for lat, lng in points:
+            validate_coordinates(lat, lng)
+
+        lats = [lat for lat, _ in points]
+        lngs = [lng for _, lng in points]
+        # The vertices are taken as is, so a polygon that crosses the antimeridian would wrap around the whole globe.
+        if max(lngs) - min(lngs) > 180:
+            raise ValueError(f"The polygon of '{city}' spans more than 180 longitude degrees (crossing the antimeridian isn't supported).")
+        area = {'city': city.lower(), 'type': 'polygon', 'points': [(float(lat), float(lng)) for lat, lng in points]}
+        self._insert(area, min(lats), min(lngs), max(lats), max(lngs))
+
+    def add_radius(self, city: str, lat: float, lng: float, radius_km: float) -> None:
+        """
+        :param city: the city that the area belongs to
+        :param lat: center latitude
+        :param lng: center longitude
+        :param radius_km: radius in kilometers
+        """
+        validate_city(city)
+        validate_coordinates(lat, lng)
+        if not 0 < radius_km <= MAX_RADIUS_KM:
+            raise ValueError(f"The radius must be between 0 and {MAX_RADIUS_KM}km, got {radius_km}.")
+
+        lat_delta = radius_km / KM_PER_LAT_DEGREE
+        lng_delta = radius_km / (KM_PER_LAT_DEGREE * max(math.cos(math.radians(lat)), 0.01))
+        area = {'city': city.lower(), 'type': 'radius', 'center': (float(lat), float(lng)), 'radius_km': float(radius_km)}
+        self._insert(area, lat - lat_delta, lng - lng_delta, lat + lat_delta, lng + lng_delta)
+
+    def query(self, lat: float, lng: float) -> set:
+        """
+        This method returns the cities (lower case) whose service areas contain the provided point.
+        """
+        cities = set()
+        for area in self._cells.get(self._cell(lat, lng), []):
+            if area['city'] in cities:
+                continue
+            if area['type'] == 'polygon':
+                inside = point_in_polygon(lat, lng, area['points'])
+            else:
+                inside = haversine_km(lat, lng, *area['center']) <= area['radius_km']
+            if inside:
+                cities.add(area['city'])
+
+        return cities
+
+
+def validate_city(city: str) -> None:
+    if not isinstance(city, str) or not city.strip():
+        raise ValueError(f"Invalid city '{city}'.")
+
+
+def validate_coordinates(lat: float, lng: float) -> None:
+    # The negated range checks also reject NaN.
+    if not -90 <= lat <= 90 or not -180 <= lng <= 180:
+        raise ValueError(f"Invalid coordinates ({lat}, {lng}).")
+
+
+def point_in_polygon(lat: float, lng: float, points: list) -> bool:
+    """
+    Ray casting - counts how many polygon edges are crossed by a ray from the point.
+    """
+    inside = False
+    j = len(points) - 1
+    for i in range(len(points)):
+        lat_i, lng_i = points[i]
+        lat_j, lng_j = points[j]
+        if (lng_i > lng) != (lng_j > lng) and lat < (lat_j - lat_i) * (lng - lng_i) / (lng_j - lng_i) + lat_i:
+            inside = not inside
+        j = i
+
+    return inside
+
+
+def haversine_km(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    d_lat = math.radians(lat2 - lat1)
+    d_lng = math.radians(lng2 - lng1)
+    a = math.sin(d_lat / 2) ** 2 + math.cos(math.radians(lat1)) * math.cos(math.radians(lat2)) * math.sin(d_lng / 2) ** 2
+
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))